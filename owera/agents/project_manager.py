@@ -1,7 +1,16 @@
-from typing import List, Optional
+from typing import Callable, Optional, Tuple
 from datetime import datetime
 from .base import BaseAgent
 from ..models.base import Task, Project, Feature
+from ..models._clock import frozen_now
+
+# (task type, assigned role, whether the feature needs it), in planning order
+_PLANNING_STEPS: Tuple[Tuple[str, str, Callable[[Feature], bool]], ...] = (
+    ("design", "UI Specialist", lambda f: not f.has_design),
+    ("implement", "Developer", lambda f: f.has_design and not f.has_implementation),
+    ("test", "QA Specialist", lambda f: f.has_implementation and not f.has_passed_tests),
+    ("review", "Product Owner", lambda f: f.has_passed_tests and not f.is_approved),
+)
 
 class ProjectManager(BaseAgent):
     """Agent responsible for project planning and task coordination."""
@@ -14,44 +23,25 @@ class ProjectManager(BaseAgent):
         """Plan tasks for all features in the project."""
         self.logger.info("Planning tasks for features")
         
-        for feature in project.features:
-            self._plan_feature_tasks(feature, project)
+        with frozen_now():
+            for feature in project.features:
+                self._plan_feature_tasks(feature, project)
         
         self.logger.info(f"Planned {len(project.tasks)} tasks")
     
     def _plan_feature_tasks(self, feature: Feature, project: Project) -> None:
         """Plan tasks for a single feature."""
-        # Design task
-        if not feature.has_design and not self._has_task(feature, "design", project.tasks):
-            task = Task("design", feature, f"Design {feature.name}")
-            task.assigned_to = "UI Specialist"
-            project.tasks.append(task)
-            self.logger.debug(f"Assigned design task for feature: {feature.name}")
-        
-        # Implementation task
-        elif feature.has_design and not feature.has_implementation and not self._has_task(feature, "implement", project.tasks):
-            task = Task("implement", feature, f"Implement {feature.name}")
-            task.assigned_to = "Developer"
-            project.tasks.append(task)
-            self.logger.debug(f"Assigned implement task for feature: {feature.name}")
-        
-        # Testing task
-        elif feature.has_implementation and not feature.has_passed_tests and not self._has_task(feature, "test", project.tasks):
-            task = Task("test", feature, f"Test {feature.name}")
-            task.assigned_to = "QA Specialist"
-            project.tasks.append(task)
-            self.logger.debug(f"Assigned test task for feature: {feature.name}")
-        
-        # Review task
-        elif feature.has_passed_tests and not feature.is_approved and not self._has_task(feature, "review", project.tasks):
-            task = Task("review", feature, f"Review {feature.name}")
-            task.assigned_to = "Product Owner"
-            project.tasks.append(task)
-            self.logger.debug(f"Assigned review task for feature: {feature.name}")
+        for task_type, role, is_needed in _PLANNING_STEPS:
+            if is_needed(feature) and not self._has_task(feature, task_type, project):
+                task = Task(task_type, feature, f"{task_type.capitalize()} {feature.name}")
+                task.assigned_to = role
+                project.add_task(task)
+                self.logger.debug(f"Assigned {task_type} task for feature: {feature.name}")
+                break
     
-    def _has_task(self, feature: Feature, task_type: str, tasks: List[Task]) -> bool:
+    def _has_task(self, feature: Feature, task_type: str, project: Project) -> bool:
         """Check if a feature already has a specific type of task."""
-        return any(t.feature == feature and t.type == task_type for t in tasks)
+        return project.get_task(feature.name, task_type) is not None
     
     def generate_prompt(self, task: Task, project: Project) -> str:
         """Project Manager doesn't need to generate prompts."""
@@ -27,7 +27,8 @@ class QASpecialist(BaseAgent):
     
     def process_response(self, response: str, task: Task, project: Project) -> None:
         """Process the testing results."""
-        if "no issues" in response.lower() or "passes" in response.lower():
+        verdict = response.lower()
+        if "no issues" in verdict or "passes" in verdict:
             task.feature.has_passed_tests = True
             self.logger.info(f"Feature '{task.feature.name}' passed QA testing")
         else:
@@ -38,7 +39,7 @@ class QASpecialist(BaseAgent):
             # Create a fix task
             fix_task = Task("fix", task.feature, f"Fix: {response}")
             fix_task.assigned_to = "Developer"
-            project.tasks.append(fix_task)
+            project.add_task(fix_task)
     
     def extract_code(self, response: str) -> str:
         """QA Specialist doesn't need to extract code."""
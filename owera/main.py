@@ -1,17 +1,10 @@
 import os
 import logging
+from logging.handlers import RotatingFileHandler
 import click
 from tqdm import tqdm
-from owera.utils.spec_parser import parse_spec_string
-from owera.utils.code_generator import generate_output
+from owera.utils.spec_parser import parse_spec_string, parse_spec_file
 from owera.models.base import Project
-from owera.agents import (
-    UISpecialist,
-    Developer,
-    QASpecialist,
-    ProductOwner,
-    ProjectManager
-)
 from owera.config import Config
 
 config = Config()
@@ -28,7 +21,12 @@ def setup_logging(debug: bool) -> None:
         level=log_level,
         format=log_format,
         handlers=[
-            logging.FileHandler("logs/development.log"),
+            RotatingFileHandler(
+                "logs/development.log",
+                maxBytes=10 * 1024 * 1024,
+                backupCount=3,
+                delay=True
+            ),
             logging.StreamHandler()
         ]
     )
@@ -49,20 +47,32 @@ def owera(spec: str, spec_file: str, output: str, debug: bool) -> None:
         if not spec and not spec_file:
             raise click.UsageError("Either --spec or --spec-file must be provided")
         
-        if spec_file:
-            with open(spec_file) as f:
-                spec = f.read()
-        
         # Parse specification
-        spec_data = parse_spec_string(spec)
+        if spec_file:
+            spec_data = parse_spec_file(spec_file)
+        else:
+            spec_data = parse_spec_string(spec)
         project = Project(spec_data)
 
-        # Initialize agents
+        # Initialize agents (imported here to keep CLI startup fast)
+        from owera.agents import (
+            UISpecialist,
+            Developer,
+            QASpecialist,
+            ProductOwner,
+            ProjectManager
+        )
         ui_specialist = UISpecialist()
         developer = Developer()
         qa_specialist = QASpecialist()
         product_owner = ProductOwner()
         project_manager = ProjectManager()
+        agent_map = {
+            "UI Specialist": ui_specialist,
+            "Developer": developer,
+            "QA Specialist": qa_specialist,
+            "Product Owner": product_owner
+        }
 
         # Main development loop
         max_iterations = config.MAX_ITERATIONS
@@ -70,22 +80,13 @@ def owera(spec: str, spec_file: str, output: str, debug: bool) -> None:
             for i in range(max_iterations):
                 # Plan tasks
                 project_manager.plan(project)
-                if not project.tasks:
+                if not project.has_todo_tasks():
                     logger.info("No more tasks to process")
                     break
 
-                # Process tasks
-                for task in project.tasks:
-                    if task.status != "todo":
-                        continue
-
-                    agent = {
-                        "UI Specialist": ui_specialist,
-                        "Developer": developer,
-                        "QA Specialist": qa_specialist,
-                        "Product Owner": product_owner
-                    }.get(task.assigned_to)
-
+                # Process pending tasks
+                while (task := project.pop_todo_task()) is not None:
+                    agent = agent_map.get(task.assigned_to)
                     if agent:
                         agent.perform_task(task, project)
 
@@ -94,6 +95,7 @@ def owera(spec: str, spec_file: str, output: str, debug: bool) -> None:
                     logger.warning("Reached maximum iterations")
 
         # Generate output
+        from owera.utils.code_generator import generate_output
         generate_output(project, output)
         logger.info(f"App generated successfully in {output}/")
 
@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator, Optional
+
+_frozen: ContextVar[Optional[datetime]] = ContextVar("owera_frozen_now", default=None)
+
+def _now() -> datetime:
+    """Get the current time, or the frozen batch time if one is active."""
+    return _frozen.get() or datetime.now()
+
+@contextmanager
+def frozen_now() -> Iterator[datetime]:
+    """Share a single timestamp across all models created in the block."""
+    token = _frozen.set(datetime.now())
+    try:
+        yield _frozen.get()
+    finally:
+        _frozen.reset(token)
@@ -1,9 +1,28 @@
-from typing import List, Optional, Dict, Any
+import sys
+from collections import deque
+from typing import List, Optional, Dict, Any, Tuple, Deque, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
+from ._clock import _now
 
-@dataclass
+# Slotted dataclasses are only available on Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def _default_code() -> Dict[str, List[str]]:
+    """Get an empty code store for a project."""
+    return {"backend": [], "frontend": []}
+
+def _remove_identical(items: Any, item: Any) -> bool:
+    """Remove an object from a list or deque by identity, not equality."""
+    # Dataclass __eq__ compares by value, so list.remove could drop a twin
+    for i, candidate in enumerate(items):
+        if candidate is item:
+            del items[i]
+            return True
+    return False
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Feature:
     """Represents a feature in the project."""
     name: str
@@ -15,16 +34,29 @@ class Feature:
     is_approved: bool = False
     issues: List['Issue'] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Issue:
     """Represents an issue in a feature."""
     description: str
     feature: Feature
     is_resolved: bool = False
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
     resolved_at: Optional[datetime] = None
 
-@dataclass
+def _mark_completed(task: 'Task') -> None:
+    """Record when a task was completed."""
+    task.completed_at = datetime.now()
+
+# Status -> action run when a task enters that status
+_STATUS_ACTIONS: Dict[str, Optional[Callable[['Task'], None]]] = {
+    "todo": None,
+    "in_progress": None,
+    "done": _mark_completed,
+    "failed": None
+}
+_MISSING = object()
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Task:
     """Represents a task in the project."""
     type: str
@@ -32,10 +64,10 @@ class Task:
     description: str
     _status: str = field(default="todo")
     assigned_to: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
     completed_at: Optional[datetime] = None
 
-    VALID_STATUSES = ["todo", "in_progress", "done", "failed"]
+    VALID_STATUSES = frozenset(_STATUS_ACTIONS)
 
     @property
     def status(self) -> str:
@@ -45,20 +77,21 @@ class Task:
     @status.setter
     def status(self, value: str) -> None:
         """Set the task status with validation."""
-        if value not in self.VALID_STATUSES:
-            raise ValueError(f"Invalid status: {value}. Must be one of {self.VALID_STATUSES}")
+        action = _STATUS_ACTIONS.get(value, _MISSING)
+        if action is _MISSING:
+            raise ValueError(f"Invalid status: {value}. Must be one of {sorted(self.VALID_STATUSES)}")
         self._status = value
-        if value == "done":
-            self.completed_at = datetime.now()
+        if action is not None:
+            action(self)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class User:
     """Represents a user in the system."""
     id: int
     email: str
     password: str
     role: str
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
     
     def set_password(self, password: str) -> None:
         """Set the user's password with hashing."""
@@ -68,7 +101,7 @@ class User:
         """Check if the provided password matches the stored hash."""
         return check_password_hash(self.password, password)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Course:
     """Represents a course in the system."""
     id: int
@@ -76,31 +109,35 @@ class Course:
     subject: str
     description: str
     instructor_id: int
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Enrollment:
     """Represents a course enrollment."""
     id: int
     user_id: int
     course_id: int
     progress: float = 0.0
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Project:
     """Represents a project in the system."""
     name: str
     tech_stack: Dict[str, str]
     features: List['Feature'] = field(default_factory=list)
+    # Task history; go through add_task/requeue so pending tasks get dispatched
     tasks: List['Task'] = field(default_factory=list)
     issues: List['Issue'] = field(default_factory=list)
-    code: Dict[str, List[str]] = field(default_factory=lambda: {"backend": [], "frontend": []})
+    code: Dict[str, List[str]] = field(default_factory=_default_code)
     designs: Dict[str, str] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     specs: Dict[str, Any] = field(default_factory=dict)
+    _feature_idx: Dict[str, Feature] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _task_idx: Dict[Tuple[str, str], Task] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _todo_tasks: Deque[Task] = field(default_factory=deque, init=False, repr=False, compare=False)
 
     def __init__(self, data: Dict[str, Any] = None):
         """Initialize project from dictionary if needed."""
@@ -133,7 +170,72 @@ class Project:
         ]
         self.tasks = []
         self.issues = []
-        self.code = {"backend": [], "frontend": []}
+        self.code = _default_code()
         self.designs = {}
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now() 
\ No newline at end of file
+        self.created_at = self.updated_at = _now()
+        self._feature_idx = {f.name: f for f in self.features}
+        self._task_idx = {}
+        self._todo_tasks = deque()
+
+    def get_feature(self, name: str) -> Feature:
+        """Get a feature by name."""
+        try:
+            return self._feature_idx[name]
+        except KeyError:
+            raise ValueError(f"Unknown feature: {name}")
+
+    def add_feature(self, feature: Feature) -> None:
+        """Add a feature to the project."""
+        self.features.append(feature)
+        self._feature_idx[feature.name] = feature
+
+    def remove_feature(self, name: str) -> None:
+        """Remove a feature by name."""
+        feature = self._feature_idx.pop(name, None)
+        if feature is None:
+            raise ValueError(f"Unknown feature: {name}")
+        _remove_identical(self.features, feature)
+
+    def get_task(self, feature_name: str, task_type: str) -> Optional[Task]:
+        """Get the most recent task of a given type for a feature."""
+        return self._task_idx.get((feature_name, task_type))
+
+    def add_task(self, task: Task) -> None:
+        """Add a task to the project, queueing it if it is pending."""
+        self.tasks.append(task)
+        self._task_idx[(task.feature.name, task.type)] = task
+        if task.status == "todo":
+            self._todo_tasks.append(task)
+
+    def requeue(self, task: Task) -> None:
+        """Reset a task to "todo" and queue it for dispatch again."""
+        task.status = "todo"
+        if not any(t is task for t in self._todo_tasks):
+            self._todo_tasks.append(task)
+
+    def remove_task(self, task: Task) -> None:
+        """Remove a task from the project."""
+        if not _remove_identical(self.tasks, task):
+            raise ValueError(f"Unknown task: {task.description}")
+        _remove_identical(self._todo_tasks, task)
+
+        # Fall back to the previous task of the same kind, if any
+        key = (task.feature.name, task.type)
+        if self._task_idx.get(key) is task:
+            previous = next((t for t in reversed(self.tasks) if (t.feature.name, t.type) == key), None)
+            if previous is None:
+                del self._task_idx[key]
+            else:
+                self._task_idx[key] = previous
+
+    def has_todo_tasks(self) -> bool:
+        """Check if any task is still waiting to be dispatched."""
+        return any(t.status == "todo" for t in self._todo_tasks)
+
+    def pop_todo_task(self) -> Optional[Task]:
+        """Pop the next pending task, or None if nothing is pending."""
+        while self._todo_tasks:
+            task = self._todo_tasks.popleft()
+            if task.status == "todo":
+                return task
+        return None 
\ No newline at end of file
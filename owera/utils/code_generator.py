@@ -1,7 +1,11 @@
 import os
-import git
+import errno
+import shutil
 import logging
-from typing import Dict, Any
+import functools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, NamedTuple
 from ..models.base import Project
 from ..config import config
 
@@ -11,57 +15,171 @@ class CodeGenerationError(Exception):
     """Raised when code generation fails."""
     pass
 
+# Static templates, shared by every generated project (pre-encoded)
+_LOGIN_HTML = b"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Login</title>
+    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
+</head>
+<body class="bg-gray-100 font-sans">
+    <div class="container mx-auto py-12">
+        <h2 class="text-3xl font-bold mb-6 text-center">Login</h2>
+        {% if error %}
+        <p class="text-red-500 text-center">{{ error }}</p>
+        {% endif %}
+        <form method="POST" class="max-w-md mx-auto bg-white p-6 rounded-lg shadow-lg">
+            <div class="mb-4">
+                <label class="block text-gray-700">Email</label>
+                <input type="email" name="email" class="w-full p-2 border rounded" required>
+            </div>
+            <div class="mb-4">
+                <label class="block text-gray-700">Password</label>
+                <input type="password" name="password" class="w-full p-2 border rounded" required>
+            </div>
+            <button type="submit" class="w-full bg-blue-500 text-white p-2 rounded hover:bg-blue-600">Login</button>
+        </form>
+        <p class="text-center mt-4">Don't have an account? <a href="{{ url_for('register') }}" class="text-blue-500">Register</a></p>
+    </div>
+</body>
+</html>"""
+
+_REGISTER_HTML = b"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Register</title>
+    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
+</head>
+<body class="bg-gray-100 font-sans">
+    <div class="container mx-auto py-12">
+        <h2 class="text-3xl font-bold mb-6 text-center">Register</h2>
+        <form method="POST" class="max-w-md mx-auto bg-white p-6 rounded-lg shadow-lg">
+            <div class="mb-4">
+                <label class="block text-gray-700">Email</label>
+                <input type="email" name="email" class="w-full p-2 border rounded" required>
+            </div>
+            <div class="mb-4">
+                <label class="block text-gray-700">Password</label>
+                <input type="password" name="password" class="w-full p-2 border rounded" required>
+            </div>
+            <div class="mb-4">
+                <label class="block text-gray-700">Role</label>
+                <select name="role" class="w-full p-2 border rounded">
+                    <option value="student">Student</option>
+                    <option value="teacher">Teacher</option>
+                </select>
+            </div>
+            <button type="submit" class="w-full bg-blue-500 text-white p-2 rounded hover:bg-blue-600">Register</button>
+        </form>
+        <p class="text-center mt-4">Already have an account? <a href="{{ url_for('login') }}" class="text-blue-500">Login</a></p>
+    </div>
+</body>
+</html>"""
+
+_FALLBACK_HOME_HTML = b"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Home</title>
+    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
+</head>
+<body class="bg-gray-100 font-sans">
+    <div class="container mx-auto py-12">
+        <h2 class="text-3xl font-bold mb-6 text-center">Welcome to Our Blog</h2>
+        <div class="max-w-4xl mx-auto bg-white p-6 rounded-lg shadow-lg">
+            <p class="text-gray-600">This is the home page of our blog. Feel free to explore!</p>
+            <div class="mt-6">
+                <a href="{{ url_for('login') }}" class="text-blue-500 hover:text-blue-700">Login</a>
+                <span class="mx-2">|</span>
+                <a href="{{ url_for('register') }}" class="text-blue-500 hover:text-blue-700">Register</a>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+
+# Entry point appended to every generated app.py
+_APP_MAIN = b"\n\nif __name__ == \"__main__\":\n    app.run(debug=True)\n"
+
+# Directories created inside every output folder
+_SUBDIRS = ("src", "templates", "docs", "logs")
+
+# Template writes go through a thread pool of this size only when there are
+# more files than workers; below that, pool startup costs more than it saves
+_TEMPLATE_WRITERS = 8
+
+class _Paths(NamedTuple):
+    """Output locations, computed once per generate_output call."""
+    root: str
+    # Subdirectory fields follow the order of _SUBDIRS
+    src: str
+    templates: str
+    docs: str
+    logs: str
+
+    @classmethod
+    def for_output(cls, output_dir: str) -> "_Paths":
+        """Build the paths for an output directory."""
+        return cls(output_dir, *(f"{output_dir}/{subdir}" for subdir in _SUBDIRS))
+
 def generate_output(project: Project, output_dir: str) -> None:
     """Generate the final application files."""
     try:
         logger.info("Generating output files")
-        _create_directories(output_dir)
+        paths = _Paths.for_output(output_dir)
+        _create_directories(paths)
         _initialize_code(project)
-        _generate_app_code(project, output_dir)
-        _generate_templates(project, output_dir)
-        _generate_docs(project, output_dir)
-        _setup_git(output_dir)
+        _generate_app_code(project, paths)
+        _generate_templates(project, paths)
+        _generate_docs(project, paths)
+        _setup_git(paths)
         
     except Exception as e:
-        logger.error(f"Failed to generate output: {str(e)}")
+        logger.error("Failed to generate output: %s", e)
         raise CodeGenerationError(f"Failed to generate output: {str(e)}")
 
-def _create_directories(output_dir: str) -> None:
+def _create_directories(paths: _Paths) -> None:
     """Create necessary directories for the project."""
-    os.makedirs(output_dir, exist_ok=True)
-    os.makedirs(f"{output_dir}/src", exist_ok=True)
-    os.makedirs(f"{output_dir}/templates", exist_ok=True)
-    os.makedirs(f"{output_dir}/docs", exist_ok=True)
-    os.makedirs(f"{output_dir}/logs", exist_ok=True)
+    os.makedirs(paths.root, exist_ok=True)
+    # The parent exists now, so skip makedirs' per-path parent walk
+    for subdir in paths[1:]:
+        try:
+            os.mkdir(subdir)
+        except FileExistsError:
+            pass
 
 def _initialize_code(project: Project) -> None:
     """Initialize code dictionaries."""
-    if not hasattr(project, "code"):
-        project.code = {}
-    if "backend" not in project.code:
-        project.code["backend"] = []
-    if "frontend" not in project.code:
-        project.code["frontend"] = []
-    if not hasattr(project, "designs"):
-        project.designs = {}
-    if not hasattr(project, "tasks"):
-        project.tasks = []
-    if not hasattr(project, "issues"):
-        project.issues = []
-
-def _generate_app_code(project: Project, output_dir: str) -> None:
+    # Project defaults every collection; callers may still replace code wholesale
+    project.code.setdefault("backend", [])
+    project.code.setdefault("frontend", [])
+
+def _generate_app_code(project: Project, paths: _Paths) -> None:
     """Generate the main application code."""
-    app_code = _get_base_app_code()
-    app_code += "\n\n" + "\n\n".join(project.code["backend"])
-    app_code += "\n\nif __name__ == \"__main__\":\n    app.run(debug=True)\n"
-    
-    app_path = f"{output_dir}/src/app.py"
-    with open(app_path, "w") as f:
-        f.write(app_code)
-    logger.info(f"Generated app code at {app_path}")
+    # Stream pre-encoded fragments so the joined backend never exists in memory
+    app_path = f"{paths.src}/app.py"
+    with open(app_path, "wb", buffering=1 << 20) as f:
+        f.write(_get_base_app_code().encode("utf-8"))
+        f.write(b"\n\n")
+        for i, snippet in enumerate(project.code["backend"]):
+            if i:
+                f.write(b"\n\n")
+            f.write(snippet.encode("utf-8"))
+        f.write(_APP_MAIN)
+    logger.info("Generated app code at %s", app_path)
 
 def _get_base_app_code() -> str:
     """Get the base Flask application code."""
+    return _render_base_app_code(config.SECRET_KEY, config.DATABASE_URI)
+
+@functools.lru_cache(maxsize=1)
+def _render_base_app_code(secret_key: str, database_uri: str) -> str:
+    """Render the base Flask application code for the given settings."""
     return f"""from flask import Flask, render_template, request, redirect, url_for, session, jsonify
 from flask_sqlalchemy import SQLAlchemy
 import jwt
@@ -71,8 +189,8 @@ from functools import wraps
 
 app = Flask(__name__, 
     template_folder=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates'))
-app.config['SECRET_KEY'] = '{config.SECRET_KEY}'
-app.config['SQLALCHEMY_DATABASE_URI'] = '{config.DATABASE_URI}'
+app.config['SECRET_KEY'] = '{secret_key}'
+app.config['SQLALCHEMY_DATABASE_URI'] = '{database_uri}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db = SQLAlchemy(app)
 
@@ -173,162 +291,88 @@ def internal_error(error):
 with app.app_context():
     db.create_all()"""
 
-def _generate_templates(project: Project, output_dir: str) -> None:
+def _generate_templates(project: Project, paths: _Paths) -> None:
     """Generate HTML templates."""
-    # Create templates directory if it doesn't exist
-    templates_dir = f"{output_dir}/templates"
-    os.makedirs(templates_dir, exist_ok=True)
-    logger.info(f"Created templates directory: {templates_dir}")
+    # _create_directories has already made the templates directory
+    templates_dir = paths.templates
     
-    # Generate login template
-    login_html = _get_login_template()
-    login_path = f"{templates_dir}/login.html"
-    with open(login_path, "w") as f:
-        f.write(login_html)
-    logger.info(f"Generated login template: {login_path}")
-    
-    # Generate register template
-    register_html = _get_register_template()
-    register_path = f"{templates_dir}/register.html"
-    with open(register_path, "w") as f:
-        f.write(register_html)
-    logger.info(f"Generated register template: {register_path}")
-    
-    # Generate feature templates
+    # Later entries win, so feature designs override the static templates
+    templates = {
+        f"{templates_dir}/login.html": _LOGIN_HTML,
+        f"{templates_dir}/register.html": _REGISTER_HTML
+    }
     for feature_name, design in project.designs.items():
         template_name = feature_name.replace("_", "")  # Remove underscores for template name
-        template_path = f"{templates_dir}/{template_name}.html"
-        with open(template_path, "w") as f:
-            f.write(design)
-        logger.info(f"Generated template: {template_path}")
+        templates[f"{templates_dir}/{template_name}.html"] = design.encode("utf-8")
     
-    # Generate home template if it doesn't exist
+    # Fall back to the stock home page when no feature design provides one
     home_path = f"{templates_dir}/home.html"
-    if not os.path.exists(home_path):
-        home_html = _get_fallback_home_template()
-        with open(home_path, "w") as f:
-            f.write(home_html)
-        logger.info(f"Generated fallback home template: {home_path}")
-
-def _get_login_template() -> str:
-    """Get the login template."""
-    return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Login</title>
-    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-</head>
-<body class="bg-gray-100 font-sans">
-    <div class="container mx-auto py-12">
-        <h2 class="text-3xl font-bold mb-6 text-center">Login</h2>
-        {% if error %}
-        <p class="text-red-500 text-center">{{ error }}</p>
-        {% endif %}
-        <form method="POST" class="max-w-md mx-auto bg-white p-6 rounded-lg shadow-lg">
-            <div class="mb-4">
-                <label class="block text-gray-700">Email</label>
-                <input type="email" name="email" class="w-full p-2 border rounded" required>
-            </div>
-            <div class="mb-4">
-                <label class="block text-gray-700">Password</label>
-                <input type="password" name="password" class="w-full p-2 border rounded" required>
-            </div>
-            <button type="submit" class="w-full bg-blue-500 text-white p-2 rounded hover:bg-blue-600">Login</button>
-        </form>
-        <p class="text-center mt-4">Don't have an account? <a href="{{ url_for('register') }}" class="text-blue-500">Register</a></p>
-    </div>
-</body>
-</html>"""
-
-def _get_register_template() -> str:
-    """Get the register template."""
-    return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Register</title>
-    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-</head>
-<body class="bg-gray-100 font-sans">
-    <div class="container mx-auto py-12">
-        <h2 class="text-3xl font-bold mb-6 text-center">Register</h2>
-        <form method="POST" class="max-w-md mx-auto bg-white p-6 rounded-lg shadow-lg">
-            <div class="mb-4">
-                <label class="block text-gray-700">Email</label>
-                <input type="email" name="email" class="w-full p-2 border rounded" required>
-            </div>
-            <div class="mb-4">
-                <label class="block text-gray-700">Password</label>
-                <input type="password" name="password" class="w-full p-2 border rounded" required>
-            </div>
-            <div class="mb-4">
-                <label class="block text-gray-700">Role</label>
-                <select name="role" class="w-full p-2 border rounded">
-                    <option value="student">Student</option>
-                    <option value="teacher">Teacher</option>
-                </select>
-            </div>
-            <button type="submit" class="w-full bg-blue-500 text-white p-2 rounded hover:bg-blue-600">Register</button>
-        </form>
-        <p class="text-center mt-4">Already have an account? <a href="{{ url_for('login') }}" class="text-blue-500">Login</a></p>
-    </div>
-</body>
-</html>"""
+    if home_path not in templates:
+        templates[home_path] = _FALLBACK_HOME_HTML
+        logger.info("Using fallback home template: %s", home_path)
+    
+    if len(templates) > _TEMPLATE_WRITERS:
+        # Template files are independent, so write large sets concurrently
+        with ThreadPoolExecutor(max_workers=_TEMPLATE_WRITERS) as executor:
+            list(executor.map(_write_file, templates.keys(), templates.values()))
+    else:
+        for template_path, data in templates.items():
+            _write_file(template_path, data)
+    for template_path in templates:
+        logger.info("Generated template: %s", template_path)
 
-def _get_fallback_home_template() -> str:
-    """Get a fallback home template."""
-    return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Home</title>
-    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-</head>
-<body class="bg-gray-100 font-sans">
-    <div class="container mx-auto py-12">
-        <h2 class="text-3xl font-bold mb-6 text-center">Welcome to Our Blog</h2>
-        <div class="max-w-4xl mx-auto bg-white p-6 rounded-lg shadow-lg">
-            <p class="text-gray-600">This is the home page of our blog. Feel free to explore!</p>
-            <div class="mt-6">
-                <a href="{{ url_for('login') }}" class="text-blue-500 hover:text-blue-700">Login</a>
-                <span class="mx-2">|</span>
-                <a href="{{ url_for('register') }}" class="text-blue-500 hover:text-blue-700">Register</a>
-            </div>
-        </div>
-    </div>
-</body>
-</html>"""
+def _write_file(path: str, data: bytes) -> None:
+    """Write a generated file."""
+    # Binary mode skips the text codec; the buffered writer retries short writes
+    with open(path, "wb") as f:
+        f.write(data)
 
-def _generate_docs(project: Project, output_dir: str) -> None:
+def _generate_docs(project: Project, paths: _Paths) -> None:
     """Generate documentation."""
-    readme_content = (
-        f"# {project.specs['project']['name']}\n\n"
-        f"A web app built by Owera.\n\n"
-        f"## Features\n" +
-        "\n".join(f"- **{f.name}**: {f.description}" for f in project.features) +
-        f"\n\n## Setup\n"
-        f"1. Install Python and required packages (`pip install flask flask-sqlalchemy pyjwt`).\n"
-        f"2. Run `python src/app.py`.\n"
-        f"3. Visit `http://localhost:5000`."
-    )
+    # Assemble the README once and hand it to a single write
+    lines = [f"# {project.specs['project']['name']}", "", "A web app built by Owera.", "", "## Features"]
+    lines.extend(f"- **{feature.name}**: {feature.description}" for feature in project.features)
+    lines.extend([
+        "",
+        "## Setup",
+        "1. Install Python and required packages (`pip install flask flask-sqlalchemy pyjwt`).",
+        "2. Run `python src/app.py`.",
+        "3. Visit `http://localhost:5000`."
+    ])
+    _write_file(f"{paths.docs}/README.md", "\n".join(lines).encode("utf-8"))
     
-    with open(f"{output_dir}/docs/README.md", "w") as f:
-        f.write(readme_content)
-    
-    # Move development log if it exists
-    if os.path.exists("development.log"):
-        os.rename("development.log", f"{output_dir}/logs/development.log")
-    else:
-        # Create an empty log file if it doesn't exist
-        with open(f"{output_dir}/logs/development.log", "w") as f:
-            f.write("Development log initialized\n")
+    # Move the development log, creating a fresh one if there is none
+    log_path = f"{paths.logs}/development.log"
+    try:
+        os.replace("development.log", log_path)
+    except FileNotFoundError:
+        _write_file(log_path, b"Development log initialized\n")
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Cross-device move; copyfile uses sendfile where available
+        shutil.copyfile("development.log", log_path)
+        os.remove("development.log")
 
-def _setup_git(output_dir: str) -> None:
+def _setup_git(paths: _Paths) -> None:
     """Initialize git repository and make initial commit."""
-    repo = git.Repo.init(output_dir)
-    repo.index.add(["src/app.py", "templates/", "docs/README.md", "logs/development.log"])
-    repo.index.commit("Initial commit") 
\ No newline at end of file
+    _run_git(paths.root, "init", "-q")
+    _run_git(paths.root, "add", "src/app.py", "templates/", "docs/README.md", "logs/development.log")
+    # Like GitPython's index.commit, rerunning into an unchanged repo still commits
+    _run_git(paths.root, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+
+def _run_git(output_dir: str, *args: str) -> None:
+    """Run a git command inside the output directory."""
+    # EMAIL is only consulted when no user.email is configured
+    env = dict(os.environ)
+    env.setdefault("EMAIL", "contact@owera.ai")
+    result = subprocess.run(
+        ["git", "-C", output_dir, *args],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+    if result.returncode != 0:
+        # Some failures (e.g. "nothing to commit") are reported on stdout
+        raise CodeGenerationError(f"git {args[0]} failed: {result.stdout.strip()}") 
\ No newline at end of file
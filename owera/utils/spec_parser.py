@@ -7,6 +7,10 @@ from owera.config import Config
 config = Config()
 logger = logging.getLogger(__name__)
 
+# Patterns for free-text specs; case-insensitive so the input is never lowercased
+_NAME_RE = re.compile(r"build\s+(?:a\s+)?(\w+)", re.IGNORECASE)
+_FEATURE_RE = re.compile(r"(?:with|and)\s+(?:a\s+)?(\w+(?:\s+\w+)*)\s+(?:page|feature)", re.IGNORECASE)
+
 class ParsingError(Exception):
     """Raised when parsing fails."""
     pass
@@ -24,17 +28,22 @@ def parse_spec_string(spec_string: str) -> Dict[str, Any]:
             logger.error(f"Failed to parse specification: {e}")
             raise ParsingError(f"Failed to parse specification: {e}")
 
+def parse_spec_file(file_path: str) -> Dict[str, Any]:
+    """Parse a specification file into a structured format."""
+    with open(file_path) as f:
+        return parse_spec_string(f.read())
+
 def _parse_manual(spec_string: str) -> Dict[str, Any]:
     """Parse specification using manual parsing."""
     # Extract project name
     project_name = "SimpleApp"
-    name_match = re.search(r"build\s+(?:a\s+)?(\w+)", spec_string.lower())
+    name_match = _NAME_RE.search(spec_string)
     if name_match:
         project_name = name_match.group(1).title()
 
     # Extract features
     features = []
-    feature_matches = re.findall(r"(?:with|and)\s+(?:a\s+)?(\w+(?:\s+\w+)*)\s+(?:page|feature)", spec_string.lower())
+    feature_matches = _FEATURE_RE.findall(spec_string)
     
     if not feature_matches:
         features.append({
@@ -43,8 +52,10 @@ def _parse_manual(spec_string: str) -> Dict[str, Any]:
             "constraints": []
         })
     else:
+        names = set()
         for match in feature_matches:
             name = match.replace(" ", "_").lower()
+            names.add(name)
             features.append({
                 "name": name,
                 "description": f"{match.title()} page",
@@ -52,7 +63,7 @@ def _parse_manual(spec_string: str) -> Dict[str, Any]:
             })
 
         # Add home page if not already included
-        if not any(f["name"] == "home_page" for f in features):
+        if "home_page" not in names:
             features.append({
                 "name": "home_page",
                 "description": "Home page with welcome message",
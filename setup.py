@@ -7,7 +7,6 @@ setup(
     install_requires=[
         "click>=8.0.0",
         "flask>=2.0.0",
-        "gitpython>=3.1.0",
         "ollama>=0.1.0",
         "tqdm>=4.65.0",
         "python-dotenv>=0.19.0",
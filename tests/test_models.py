@@ -1,6 +1,8 @@
+import sys
 import pytest
 from datetime import datetime
-from owera.models.base import Feature, Issue, Task, User, Course, Enrollment
+from owera.models.base import Feature, Issue, Task, User, Course, Enrollment, Project
+from owera.models._clock import frozen_now
 
 def test_feature_creation():
     """Test Feature creation and default values."""
@@ -41,6 +43,15 @@ def test_task_creation():
     assert isinstance(task.created_at, datetime)
     assert task.completed_at is None
 
+def test_frozen_now_shares_timestamps():
+    """Test that models created in a frozen_now block share a timestamp."""
+    feature = Feature("test_feature", "Test description")
+    with frozen_now() as now:
+        tasks = [Task("design", feature, f"Task {i}") for i in range(3)]
+    
+    assert all(task.created_at == now for task in tasks)
+    assert Task("design", feature, "Later task").created_at >= now
+
 def test_user_password_management():
     """Test User password hashing and verification."""
     user = User(
@@ -112,7 +123,105 @@ def test_task_status_transitions():
     assert task.status == "in_progress"
     task.status = "done"
     assert task.status == "done"
+    assert isinstance(task.completed_at, datetime)
     
     # Test invalid status
     with pytest.raises(ValueError):
-        task.status = "invalid_status" 
\ No newline at end of file
+        task.status = "invalid_status" 
+
+def test_project_feature_and_task_lookup():
+    """Test Project feature and task lookup by name."""
+    project = Project({
+        "project": {"name": "TestApp"},
+        "features": [
+            {"name": "home_page", "description": "Home page"}
+        ]
+    })
+    
+    feature = project.get_feature("home_page")
+    assert feature is project.features[0]
+    with pytest.raises(ValueError):
+        project.get_feature("missing")
+    
+    about = Feature("about_page", "About page")
+    project.add_feature(about)
+    assert project.get_feature("about_page") is about
+    
+    assert project.get_task("home_page", "design") is None
+    task = Task("design", feature, "Design home_page")
+    project.add_task(task)
+    assert project.tasks == [task]
+    assert project.get_task("home_page", "design") is task
+    
+    project.remove_task(task)
+    assert project.tasks == []
+    assert project.get_task("home_page", "design") is None
+    assert project.pop_todo_task() is None
+    with pytest.raises(ValueError):
+        project.remove_task(task)
+    
+    project.remove_feature("about_page")
+    assert [f.name for f in project.features] == ["home_page"]
+    with pytest.raises(ValueError):
+        project.remove_feature("about_page")
+
+def test_project_remove_equal_tasks(sample_project):
+    """Test that removing a task drops that object, not an equal twin."""
+    home = sample_project.features[0]
+    with frozen_now():
+        first = Task("design", home, "Design home_page")
+        second = Task("design", home, "Design home_page")
+    assert first == second
+    sample_project.add_task(first)
+    sample_project.add_task(second)
+
+    sample_project.remove_task(second)
+    assert len(sample_project.tasks) == 1
+    assert sample_project.tasks[0] is first
+    assert sample_project.get_task("home_page", "design") is first
+    assert sample_project.pop_todo_task() is first
+    assert sample_project.pop_todo_task() is None
+
+def test_project_todo_queue(sample_project):
+    """Test that pending tasks are dispatched in order."""
+    home, about = sample_project.features
+    design = Task("design", home, "Design home_page")
+    review = Task("review", about, "Review about_page")
+    sample_project.add_task(design)
+    sample_project.add_task(review)
+    
+    assert sample_project.has_todo_tasks()
+    review.status = "done"
+    assert sample_project.pop_todo_task() is design
+    assert sample_project.pop_todo_task() is None
+    assert not sample_project.has_todo_tasks()
+    assert sample_project.tasks == [design, review]
+
+def test_project_requeue_task(sample_project):
+    """Test that a task set back to todo is dispatched again."""
+    home = sample_project.features[0]
+    task = Task("design", home, "Design home_page")
+    sample_project.add_task(task)
+    
+    assert sample_project.pop_todo_task() is task
+    task.status = "failed"
+    assert not sample_project.has_todo_tasks()
+    
+    sample_project.requeue(task)
+    sample_project.requeue(task)
+    assert task.status == "todo"
+    assert sample_project.has_todo_tasks()
+    assert sample_project.pop_todo_task() is task
+    assert sample_project.pop_todo_task() is None
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+def test_models_use_slots(sample_project):
+    """Test that models do not carry a per-instance __dict__."""
+    feature = sample_project.features[0]
+    task = Task("design", feature, "Design home_page")
+    
+    for obj in (sample_project, feature, task, Issue("Test issue", feature)):
+        assert not hasattr(obj, "__dict__")
+    
+    with pytest.raises(AttributeError):
+        task.unknown_attribute = True
@@ -2,7 +2,8 @@ import pytest
 import json
 import os
 from unittest.mock import patch, mock_open
-from owera.utils.spec_parser import parse_spec_string, ParsingError
+from owera.utils.spec_parser import parse_spec_string, parse_spec_file, ParsingError
+from owera.utils import code_generator
 from owera.utils.code_generator import generate_output, CodeGenerationError
 from owera.models.base import Project
 
@@ -53,9 +54,26 @@ def test_spec_parser_default():
     assert len(result["features"]) == 1
     assert result["features"][0]["name"] == "home_page"
 
+def test_spec_parser_file(temp_dir):
+    """Test specification file parsing."""
+    spec_path = os.path.join(temp_dir, "spec.json")
+    with open(spec_path, "w") as f:
+        json.dump({"project": {"name": "FileApp"}, "features": []}, f)
+    
+    assert parse_spec_file(spec_path)["project"]["name"] == "FileApp"
+    
+    # Free-text spec files fall back to manual parsing
+    with open(spec_path, "w") as f:
+        f.write("Build a blog with a contact page")
+    result = parse_spec_file(spec_path)
+    assert result["project"]["name"] == "Blog"
+    assert any(f["name"] == "contact" for f in result["features"])
+
+@patch('owera.utils.code_generator._run_git')
+@patch('os.mkdir')
 @patch('os.makedirs')
 @patch('builtins.open', new_callable=mock_open)
-def test_code_generator(mock_file, mock_makedirs):
+def test_code_generator(mock_file, mock_makedirs, mock_mkdir, mock_git):
     """Test code generation."""
     project = Project({
         "project": {
@@ -84,15 +102,23 @@ def test_code_generator(mock_file, mock_makedirs):
     generate_output(project, "test_output")
     
     # Verify directory creation
-    mock_makedirs.assert_any_call("test_output")
-    mock_makedirs.assert_any_call("test_output/src")
-    mock_makedirs.assert_any_call("test_output/templates")
-    mock_makedirs.assert_any_call("test_output/docs")
-    mock_makedirs.assert_any_call("test_output/logs")
+    mock_makedirs.assert_any_call("test_output", exist_ok=True)
+    mock_mkdir.assert_any_call("test_output/src")
+    mock_mkdir.assert_any_call("test_output/templates")
+    mock_mkdir.assert_any_call("test_output/docs")
+    mock_mkdir.assert_any_call("test_output/logs")
     
     # Verify file writing
     assert mock_file.call_count > 0
 
+def test_base_app_code_cached(monkeypatch):
+    """Test that the base app code is rendered once per configuration."""
+    first = code_generator._get_base_app_code()
+    assert code_generator._get_base_app_code() is first
+    
+    monkeypatch.setattr(code_generator.config, "SECRET_KEY", "other-secret")
+    assert "'other-secret'" in code_generator._get_base_app_code()
+
 def test_code_generator_error():
     """Test code generation error handling."""
     project = Project({
@@ -103,16 +129,19 @@ def test_code_generator_error():
     with pytest.raises(CodeGenerationError):
         generate_output(project, "/invalid/path")
 
-@patch('git.Repo')
-def test_git_setup(mock_repo):
+@patch('subprocess.run')
+def test_git_setup(mock_run):
     """Test Git repository setup."""
+    mock_run.return_value.returncode = 0
     project = Project({
         "project": {"name": "TestApp"},
         "features": []
     })
     
     generate_output(project, "test_output")
-    mock_repo.init.assert_called_once_with("test_output")
+    git_commands = [call[0][0] for call in mock_run.call_args_list]
+    assert git_commands[0] == ["git", "-C", "test_output", "init", "-q"]
+    assert git_commands[-1][3] == "commit"
 
 def test_template_generation():
     """Test HTML template generation."""
@@ -125,9 +154,11 @@ def test_template_generation():
         "test_page": "<div>Test Page</div>"
     }
     
-    with patch('builtins.open', new_callable=mock_open) as mock_file:
+    with patch('builtins.open', new_callable=mock_open) as mock_file, \
+         patch('owera.utils.code_generator._run_git'):
         generate_output(project, "test_output")
-        mock_file.assert_any_call("test_output/templates/test_page.html", "w")
+        # Underscores are stripped from template file names
+        mock_file.assert_any_call("test_output/templates/testpage.html", "wb")
 
 def test_documentation_generation():
     """Test documentation generation."""
@@ -141,11 +172,29 @@ def test_documentation_generation():
         ]
     })
     
-    with patch('builtins.open', new_callable=mock_open) as mock_file:
+    with patch('builtins.open', new_callable=mock_open) as mock_file, \
+         patch('owera.utils.code_generator._run_git'):
         generate_output(project, "test_output")
-        mock_file.assert_any_call("test_output/docs/README.md", "w")
+        mock_file.assert_any_call("test_output/docs/README.md", "wb")
         
         # Verify README content
-        write_calls = [call[0][0] for call in mock_file.mock_calls if call[0][0] == "test_output/docs/README.md"]
-        assert any("TestApp" in call for call in write_calls)
-        assert any("feature1" in call for call in write_calls) 
\ No newline at end of file
+        written = [call.args[0] for call in mock_file().write.call_args_list]
+        assert any(b"# TestApp" in data for data in written)
+        assert any(b"- **feature1**: Test feature 1" in data for data in written)
+
+def test_template_generation_concurrent(temp_dir, monkeypatch):
+    """Test that large template sets are written through the thread pool."""
+    monkeypatch.setattr(code_generator, "_TEMPLATE_WRITERS", 2)
+    project = Project({
+        "project": {"name": "TestApp"},
+        "features": []
+    })
+    project.designs = {f"page_{i}": f"<div>Page {i}</div>" for i in range(4)}
+    
+    with patch('owera.utils.code_generator._run_git'):
+        generate_output(project, temp_dir)
+    
+    for i in range(4):
+        with open(os.path.join(temp_dir, "templates", f"page{i}.html")) as f:
+            assert f.read() == f"<div>Page {i}</div>"
+    assert os.path.exists(os.path.join(temp_dir, "templates", "home.html"))